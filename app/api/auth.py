@@ -1,98 +1,192 @@
-# from fastapi import APIRouter, Depends, HTTPException, status
-# from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
-# from sqlalchemy.orm import Session
-# from datetime import datetime, timedelta
-# from jose import JWTError, jwt
-# from passlib.context import CryptContext
-# from app.database import get_db
-# from app.models import User
-# from app.schemas import UserCreate, Token
-#
-# router = APIRouter()
-# pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-# oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
-#
-# # Secret key - in production, use a secure environment variable
-# SECRET_KEY = "your-secret-key-here"  # Change this in production!
-# ALGORITHM = "HS256"
-# ACCESS_TOKEN_EXPIRE_MINUTES = 30
-#
-#
-# def create_access_token(data: dict):
-#     to_encode = data.copy()
-#     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-#     to_encode.update({"exp": expire})
-#     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-#     return encoded_jwt
-#
-#
-# @router.post("/register", response_model=Token)
-# async def register_user(user: UserCreate, db: Session = Depends(get_db)):
-#     # Check if user exists
-#     db_user = db.query(User).filter(User.username == user.username).first()
-#     if db_user:
-#         raise HTTPException(
-#             status_code=400,
-#             detail="Username already registered"
-#         )
-#
-#     # Create new user
-#     hashed_password = pwd_context.hash(user.password)
-#     db_user = User(username=user.username, hashed_password=hashed_password)
-#     db.add(db_user)
-#     db.commit()
-#     db.refresh(db_user)
-#
-#     # Create access token
-#     access_token = create_access_token(data={"sub": user.username})
-#     return {"access_token": access_token, "token_type": "bearer"}
-#
-#
-# @router.post("/token", response_model=Token)
-# async def login(
-#         form_data: OAuth2PasswordRequestForm = Depends(),
-#         db: Session = Depends(get_db)
-# ):
-#     # Check username
-#     user = db.query(User).filter(User.username == form_data.username).first()
-#     if not user:
-#         raise HTTPException(
-#             status_code=status.HTTP_401_UNAUTHORIZED,
-#             detail="Incorrect username or password",
-#             headers={"WWW-Authenticate": "Bearer"},
-#         )
-#
-#     # Check password
-#     if not pwd_context.verify(form_data.password, user.hashed_password):
-#         raise HTTPException(
-#             status_code=status.HTTP_401_UNAUTHORIZED,
-#             detail="Incorrect username or password",
-#             headers={"WWW-Authenticate": "Bearer"},
-#         )
-#
-#     # Create access token
-#     access_token = create_access_token(data={"sub": user.username})
-#     return {"access_token": access_token, "token_type": "bearer"}
-#
-#
-# async def get_current_user(
-#         token: str = Depends(oauth2_scheme),
-#         db: Session = Depends(get_db)
-# ):
-#     credentials_exception = HTTPException(
-#         status_code=status.HTTP_401_UNAUTHORIZED,
-#         detail="Could not validate credentials",
-#         headers={"WWW-Authenticate": "Bearer"},
-#     )
-#     try:
-#         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-#         username: str = payload.get("sub")
-#         if username is None:
-#             raise credentials_exception
-#     except JWTError:
-#         raise credentials_exception
-#
-#     user = db.query(User).filter(User.username == username).first()
-#     if user is None:
-#         raise credentials_exception
-#     return user
\ No newline at end of file
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import asyncio
+import bcrypt
+import hashlib
+import hmac
+import os
+import secrets
+
+from app.config import settings
+from app.database import SessionLocal
+from app.dependencies import get_db, create_access_token
+from app.models import User, RefreshToken
+from app.schemas import UserCreate, Token, RefreshRequest
+from app.scheduler import scheduler
+
+router = APIRouter()
+
+BCRYPT_ROUNDS = settings.bcrypt_rounds
+REFRESH_TOKEN_EXPIRE_DAYS = 7
+
+# bcrypt is CPU bound, so run it off the event loop on a pool capped at one
+# thread per core
+hashing_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with the native bcrypt implementation"""
+    hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return hashed.decode()
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a plaintext password against a stored bcrypt hash"""
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        # Stored hash is malformed
+        return False
+
+
+def hash_refresh_token(token: str) -> str:
+    """Keyed hash of a refresh token; cheap to check, unlike bcrypt"""
+    return hmac.new(settings.secret_key.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+
+def issue_tokens(db: AsyncSession, user: User) -> dict:
+    """Create an access token and a new refresh token for ``user``
+
+    The refresh token is added to the session; the caller commits it.
+    """
+    refresh_token = secrets.token_urlsafe(32)
+    db.add(RefreshToken(
+        user_id=user.id,
+        token_hash=hash_refresh_token(refresh_token),
+        expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    ))
+
+    access_token = create_access_token(data={"sub": user.username})
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
+    }
+
+
+@router.post("/register", response_model=Token)
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
+    # Check if user exists
+    result = await db.execute(select(User).where(User.username == user.username))
+    db_user = result.scalars().first()
+    if db_user:
+        raise HTTPException(
+            status_code=400,
+            detail="Username already registered"
+        )
+
+    # Create new user
+    loop = asyncio.get_running_loop()
+    hashed_password = await loop.run_in_executor(
+        hashing_executor, hash_password, user.password
+    )
+    db_user = User(username=user.username, hashed_password=hashed_password)
+    db.add(db_user)
+    await db.flush()  # Assigns db_user.id for the refresh token
+
+    # Create access and refresh tokens
+    tokens = issue_tokens(db, db_user)
+    await db.commit()
+    return tokens
+
+
+@router.post("/token", response_model=Token)
+async def login(
+        form_data: OAuth2PasswordRequestForm = Depends(),
+        db: AsyncSession = Depends(get_db)
+):
+    # Check username
+    result = await db.execute(select(User).where(User.username == form_data.username))
+    user = result.scalars().first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Check password
+    loop = asyncio.get_running_loop()
+    password_ok = await loop.run_in_executor(
+        hashing_executor, verify_password, form_data.password, user.hashed_password
+    )
+    if not password_ok:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Create access and refresh tokens
+    tokens = issue_tokens(db, user)
+    await db.commit()
+    return tokens
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(
+        request: RefreshRequest,
+        db: AsyncSession = Depends(get_db)
+):
+    """
+    Exchange a refresh token for a new access token.
+    The refresh token is rotated: the one presented stops working.
+    """
+    # Redeem the token atomically: only one concurrent caller can delete it
+    result = await db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(request.refresh_token))
+        .returning(RefreshToken.user_id, RefreshToken.expires_at)
+    )
+    redeemed = result.first()
+
+    user = None
+    if redeemed is not None and redeemed.expires_at > datetime.utcnow():
+        result = await db.execute(select(User).where(User.id == redeemed.user_id))
+        user = result.scalars().first()
+
+    if user is None:
+        # Still commit, so a presented expired token is removed as well
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Rotate the refresh token
+    tokens = issue_tokens(db, user)
+    await db.commit()
+    return tokens
+
+
+def purge_refresh_tokens():
+    """Background task to delete refresh tokens that can no longer be redeemed"""
+    db = SessionLocal()
+    try:
+        db.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.expires_at <= datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+
+
+# Schedule periodic purge of expired refresh tokens
+scheduler.add_job(
+    purge_refresh_tokens,
+    'interval',
+    hours=1,  # Run every hour
+    id="purge_refresh_tokens",
+    replace_existing=True  # Job store is persistent; don't re-add on every start
+)
@@ -1,29 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from typing import List, Optional
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Response
+from sqlalchemy import and_, or_, case, cast, literal, select, update, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+from typing import Optional
+from datetime import datetime, timedelta, timezone
 from app.dependencies import get_db, get_current_user
 from app.models import Event, User, EventStatus, Trigger
-from app.schemas import EventResponse
-import redis
-import os
-import json
+from app.schemas import EventPage, EventResponse
+from app.cache import async_redis_client, redis_client
 from app.database import SessionLocal
+from app.scheduler import scheduler
 
 router = APIRouter()
 
-# Initialize Redis client
-redis_client = redis.Redis(
-    host=os.getenv("REDIS_HOST", "localhost"),
-    port=int(os.getenv("REDIS_PORT", 6379)),
-    decode_responses=True
-)
+# Redis set holding every live recent-events cache key
+CACHE_INDEX_KEY = "cache_index:events"
 
 
 @router.get(
     "/recent",
-    response_model=List[EventResponse],
+    response_model=EventPage,
     dependencies=[Depends(get_current_user)],
     summary="Get Recent Events",
     description="""
@@ -39,6 +35,9 @@ redis_client = redis.Redis(
     * Timestamp when triggered
     * Payload (for API triggers)
     * Test status
+
+    Results are newest first. Pass the returned `next_cursor` values as
+    `before_triggered_at` and `before_id` to fetch the next page.
     """
 
 )
@@ -47,23 +46,43 @@ async def get_recent_events(
             False,
             description="Include test events in the results"
         ),
-        page: int = Query(1, ge=1, description="Page number"),
+        before_triggered_at: Optional[datetime] = Query(
+            None,
+            description="Cursor: triggered_at of the last event on the previous page"
+        ),
+        before_id: Optional[int] = Query(
+            None,
+            description="Cursor: id of the last event on the previous page"
+        ),
         page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     # Try to get from cache first
-    cache_key = f"recent_events:{current_user.id}:{show_test}:{page}:{page_size}"
-    cached_data = redis_client.get(cache_key)
+    cache_key = (
+        f"recent_events:{current_user.id}:{show_test}:"
+        f"{before_triggered_at}:{before_id}:{page_size}"
+    )
+    cached_data = await async_redis_client.get(cache_key)
 
     if cached_data:
-        return json.loads(cached_data)
+        # Cached bytes are already the serialized EventPage
+        return Response(content=cached_data, media_type="application/json")
 
     # Calculate time threshold
     two_hours_ago = datetime.utcnow() - timedelta(hours=2)
 
-    # Build query
-    query = db.query(Event).join(Trigger).filter(
+    # Build query; select plain columns so rows skip ORM instrumentation
+    query = select(
+        Event.id,
+        Event.trigger_id,
+        Event.status,
+        Event.payload,
+        Event.is_test,
+        Event.triggered_at,
+        Event.archived_at,
+        Event.deleted_at
+    ).join(Trigger).where(
         and_(
             Event.triggered_at >= two_hours_ago,
             Event.status == EventStatus.ACTIVE,
@@ -72,43 +91,34 @@ async def get_recent_events(
     )
 
     if not show_test:
-        query = query.filter(Event.is_test == False)
+        query = query.where(Event.is_test == False)
 
     # Apply pagination
-    offset = (page - 1) * page_size
-    events = query.order_by(Event.triggered_at.desc()) \
-        .offset(offset) \
-        .limit(page_size) \
-        .all()
+    query = paginate(query, before_triggered_at, before_id, page_size)
+    result = await db.execute(query)
+    events = result.all()
 
     # Prepare response
-    result = [
-        {
-            "id": event.id,
-            "trigger_id": event.trigger_id,
-            "status": event.status,
-            "payload": event.payload,
-            "is_test": event.is_test,
-            "triggered_at": event.triggered_at,
-            "archived_at": event.archived_at,
-            "deleted_at": event.deleted_at
-        }
-        for event in events
-    ]
-
-    # Cache for 1 minute
-    redis_client.setex(
-        cache_key,
-        60,  # 1 minute
-        json.dumps(result, default=str)
+    page = EventPage(
+        items=[EventResponse.model_validate(event) for event in events],
+        next_cursor=next_cursor(events, page_size)
     )
+    content = page.model_dump_json()
+
+    # Cache for 1 minute and record the key so invalidation needn't scan
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        pipe.set(cache_key, content, ex=60)  # 1 minute
+        pipe.sadd(CACHE_INDEX_KEY, cache_key)
+        # Every indexed entry expires within a minute, so the index can too
+        pipe.expire(CACHE_INDEX_KEY, 60)
+        await pipe.execute()
 
-    return result
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
     "/archived",
-    response_model=List[EventResponse],
+    response_model=EventPage,
     summary="Get Archived Events",
     description="""
     Get archived events (2-48 hours old).
@@ -119,6 +129,8 @@ async def get_recent_events(
     * Not cached (direct database query)
 
     Events older than 48 hours are automatically deleted.
+
+    Paginate with `before_triggered_at` and `before_id` from `next_cursor`.
     """
 )
 async def get_archived_events(
@@ -126,9 +138,16 @@ async def get_archived_events(
             False,
             description="Include test events in the results"
         ),
-        page: int = Query(1, ge=1, description="Page number"),
+        before_triggered_at: Optional[datetime] = Query(
+            None,
+            description="Cursor: triggered_at of the last event on the previous page"
+        ),
+        before_id: Optional[int] = Query(
+            None,
+            description="Cursor: id of the last event on the previous page"
+        ),
         page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     # Calculate time thresholds
@@ -136,8 +155,8 @@ async def get_archived_events(
     two_hours_ago = now - timedelta(hours=2)
     forty_eight_hours_ago = now - timedelta(hours=48)
 
-    # Build query
-    query = db.query(Event).join(Trigger).filter(
+    # Build query; reuse the filtering join to populate Event.trigger
+    query = select(Event).join(Trigger).options(contains_eager(Event.trigger)).where(
         and_(
             Event.triggered_at.between(forty_eight_hours_ago, two_hours_ago),
             Event.status == EventStatus.ARCHIVED,
@@ -146,22 +165,49 @@ async def get_archived_events(
     )
 
     if not show_test:
-        query = query.filter(Event.is_test == False)
+        query = query.where(Event.is_test == False)
 
     # Apply pagination
-    offset = (page - 1) * page_size
-    events = query.order_by(Event.triggered_at.desc()) \
-        .offset(offset) \
-        .limit(page_size) \
-        .all()
+    query = paginate(query, before_triggered_at, before_id, page_size)
+    result = await db.execute(query)
+    events = result.scalars().all()
 
-    return events
+    return {"items": events, "next_cursor": next_cursor(events, page_size)}
+
+
+def paginate(query, before_triggered_at, before_id, page_size: int):
+    """Apply keyset pagination on (triggered_at, id), newest first"""
+    if (before_triggered_at is None) != (before_id is None):
+        raise HTTPException(
+            status_code=400,
+            detail="before_triggered_at and before_id must be provided together"
+        )
+
+    if before_triggered_at is not None:
+        # triggered_at is stored as naive UTC; compare aware cursors in UTC
+        if before_triggered_at.tzinfo is not None:
+            before_triggered_at = before_triggered_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+        query = query.where(
+            tuple_(Event.triggered_at, Event.id) < tuple_(before_triggered_at, before_id)
+        )
+
+    return query.order_by(Event.triggered_at.desc(), Event.id.desc()).limit(page_size)
+
+
+def next_cursor(events, page_size: int) -> Optional[dict]:
+    """Build the cursor for the page after ``events``, if there may be one"""
+    if len(events) < page_size:
+        return None
+
+    last = events[-1]
+    return {"triggered_at": last.triggered_at, "id": last.id}
 
 
 @router.post("/cleanup")
 async def cleanup_events(
         background_tasks: BackgroundTasks,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     """
@@ -173,7 +219,7 @@ async def cleanup_events(
     return {"message": "Cleanup task scheduled"}
 
 
-async def cleanup_old_events():
+def cleanup_old_events():
     """Background task to cleanup events"""
     db = SessionLocal()
     try:
@@ -181,30 +227,47 @@ async def cleanup_old_events():
         two_hours_ago = now - timedelta(hours=2)
         forty_eight_hours_ago = now - timedelta(hours=48)
 
-        # Archive events older than 2 hours
-        archive_query = db.query(Event).filter(
-            and_(
-                Event.triggered_at <= two_hours_ago,
-                Event.status == EventStatus.ACTIVE
+        # Archive events older than 2 hours and delete events older than
+        # 48 hours in one pass over the table. SET expressions see the old
+        # row, so an active event past 48 hours goes straight to deleted,
+        # as if archived and deleted in sequence.
+        expired = Event.triggered_at <= forty_eight_hours_ago
+        status_type = Event.status.type
+        db.execute(
+            update(Event)
+            .where(
+                or_(
+                    and_(
+                        Event.triggered_at <= two_hours_ago,
+                        Event.status == EventStatus.ACTIVE
+                    ),
+                    and_(
+                        expired,
+                        Event.status == EventStatus.ARCHIVED
+                    )
+                )
             )
-        )
-
-        for event in archive_query.all():
-            event.status = EventStatus.ARCHIVED
-            event.archived_at = now
-
-        # Delete events older than 48 hours
-        delete_query = db.query(Event).filter(
-            and_(
-                Event.triggered_at <= forty_eight_hours_ago,
-                Event.status == EventStatus.ARCHIVED
+            .values(
+                # Typed literals and a cast keep the CASE result an enum
+                status=cast(
+                    case(
+                        (expired, literal(EventStatus.DELETED, status_type)),
+                        else_=literal(EventStatus.ARCHIVED, status_type)
+                    ),
+                    status_type
+                ),
+                archived_at=case(
+                    (Event.status == EventStatus.ACTIVE, now),
+                    else_=Event.archived_at
+                ),
+                deleted_at=case(
+                    (expired, now),
+                    else_=Event.deleted_at
+                )
             )
+            .execution_options(synchronize_session=False)
         )
 
-        for event in delete_query.all():
-            event.status = EventStatus.DELETED
-            event.deleted_at = now
-
         db.commit()
 
         # Clear affected caches
@@ -217,15 +280,27 @@ async def cleanup_old_events():
         db.close()
 
 
+# Number of keys removed per UNLINK command
+CACHE_CLEAR_BATCH_SIZE = 500
+
+
 def clear_event_caches():
     """Clear all event-related caches"""
-    for key in redis_client.scan_iter("recent_events:*"):
-        redis_client.delete(key)
+    keys = list(redis_client.smembers(CACHE_INDEX_KEY))
 
+    pipe = redis_client.pipeline(transaction=False)
+    # UNLINK frees the values in the background instead of blocking Redis
+    for start in range(0, len(keys), CACHE_CLEAR_BATCH_SIZE):
+        pipe.unlink(*keys[start:start + CACHE_CLEAR_BATCH_SIZE])
+    pipe.unlink(CACHE_INDEX_KEY)
+    pipe.execute()
 
-# Schedule periodic cleanup
-from apscheduler.schedulers.background import BackgroundScheduler
 
-scheduler = BackgroundScheduler()
-scheduler.add_job(cleanup_old_events, 'interval', minutes=30)  # Run every 30 minutes
-scheduler.start()
\ No newline at end of file
+# Schedule periodic cleanup
+scheduler.add_job(
+    cleanup_old_events,
+    'interval',
+    minutes=30,  # Run every 30 minutes
+    id="cleanup_old_events",
+    replace_existing=True  # Job store is persistent; don't re-add on every start
+)
\ No newline at end of file
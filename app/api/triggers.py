@@ -1,8 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from fastapi import Query, Body
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from typing_extensions import TypedDict
 
 from app.database import SessionLocal
 from app.dependencies import get_db, get_current_user
@@ -13,13 +17,11 @@ from app.schemas import (
     TriggerResponse,
     EventCreate
 )
-from apscheduler.schedulers.background import BackgroundScheduler
+from app.scheduler import scheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 router = APIRouter()
-scheduler = BackgroundScheduler()
-scheduler.start()
 
 
 @router.post(
@@ -30,7 +32,7 @@ scheduler.start()
 async def create_scheduled_trigger(
         trigger: ScheduledTriggerCreate,
         background_tasks: BackgroundTasks,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     db_trigger = Trigger(
@@ -40,14 +42,16 @@ async def create_scheduled_trigger(
         user_id=current_user.id
     )
     db.add(db_trigger)
-    db.commit()
-    db.refresh(db_trigger)
+    await db.commit()
+    await db.refresh(db_trigger)
 
-    # Schedule the trigger
+    # Schedule the trigger; the job store does blocking Redis I/O, so keep it
+    # off the event loop
     try:
         if trigger.schedule.isdigit():  # Interval in minutes
             interval_minutes = int(trigger.schedule)
-            scheduler.add_job(
+            await run_in_threadpool(
+                scheduler.add_job,
                 execute_trigger,
                 'interval',
                 minutes=interval_minutes,
@@ -56,7 +60,8 @@ async def create_scheduled_trigger(
                 replace_existing=True
             )
         else:  # Cron expression
-            scheduler.add_job(
+            await run_in_threadpool(
+                scheduler.add_job,
                 execute_trigger,
                 'cron',
                 args=[db_trigger.id],
@@ -65,8 +70,8 @@ async def create_scheduled_trigger(
                 **parse_cron(trigger.schedule)
             )
     except ValueError as e:
-        db.delete(db_trigger)
-        db.commit()
+        await db.delete(db_trigger)
+        await db.commit()
         raise HTTPException(
             status_code=400,
             detail=f"Invalid schedule format: {str(e)}"
@@ -82,11 +87,11 @@ async def create_scheduled_trigger(
 )
 async def create_api_trigger(
         trigger: APITriggerCreate,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     # Validate schema types
-    valid_types = {"str", "int", "float", "bool"}
+    valid_types = set(TYPE_MAP)
     for field, type_name in trigger.api_schema.items():
         if type_name not in valid_types:
             raise HTTPException(
@@ -94,6 +99,9 @@ async def create_api_trigger(
                 detail=f"Invalid type '{type_name}' for field '{field}'. Must be one of: {valid_types}"
             )
 
+    # Compile the payload validator before anything is written
+    adapter = build_payload_adapter(trigger.api_schema)
+
     db_trigger = Trigger(
         name=trigger.name,
         type=TriggerType.API,
@@ -101,8 +109,10 @@ async def create_api_trigger(
         user_id=current_user.id
     )
     db.add(db_trigger)
-    db.commit()
-    db.refresh(db_trigger)
+    await db.commit()
+    await db.refresh(db_trigger)
+
+    _payload_adapters[db_trigger.id] = adapter
     return db_trigger
 
 
@@ -112,14 +122,17 @@ async def create_api_trigger(
 )
 async def test_trigger(
         trigger_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
         payload: Dict[str, Any] = Body(default=None)
 ):
-    trigger = db.query(Trigger).filter(
-        Trigger.id == trigger_id,
-        Trigger.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Trigger).where(
+            Trigger.id == trigger_id,
+            Trigger.user_id == current_user.id
+        )
+    )
+    trigger = result.scalars().first()
 
     if not trigger:
         raise HTTPException(status_code=404, detail="Trigger not found")
@@ -127,7 +140,7 @@ async def test_trigger(
     if trigger.type == TriggerType.API and payload:
         # Validate payload against schema
         try:
-            validate_payload(payload, trigger.api_schema)
+            validate_payload(payload, get_payload_adapter(trigger), trigger.api_schema)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
@@ -139,7 +152,7 @@ async def test_trigger(
         status=EventStatus.ACTIVE
     )
     db.add(event)
-    db.commit()
+    await db.commit()
 
     return {"message": "Test trigger executed successfully", "event_id": event.id}
 
@@ -150,10 +163,11 @@ async def test_trigger(
     summary="List All Triggers"
 )
 async def get_triggers(
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    triggers = db.query(Trigger).filter(Trigger.user_id == current_user.id).all()
+    result = await db.execute(select(Trigger).where(Trigger.user_id == current_user.id))
+    triggers = result.scalars().all()
     return triggers
 
 
@@ -163,13 +177,16 @@ async def get_triggers(
 )
 async def delete_trigger(
         trigger_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    trigger = db.query(Trigger).filter(
-        Trigger.id == trigger_id,
-        Trigger.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Trigger).where(
+            Trigger.id == trigger_id,
+            Trigger.user_id == current_user.id
+        )
+    )
+    trigger = result.scalars().first()
 
     if not trigger:
         raise HTTPException(status_code=404, detail="Trigger not found")
@@ -177,12 +194,14 @@ async def delete_trigger(
     # Remove scheduled job if it exists
     if trigger.type == TriggerType.SCHEDULED:
         try:
-            scheduler.remove_job(f"trigger_{trigger_id}")
+            await run_in_threadpool(scheduler.remove_job, f"trigger_{trigger_id}")
         except:
             pass  # Job might not exist
 
-    db.delete(trigger)
-    db.commit()
+    _payload_adapters.pop(trigger_id, None)
+
+    await db.delete(trigger)
+    await db.commit()
     return {"message": "Trigger deleted successfully"}
 
 
@@ -204,26 +223,53 @@ def parse_cron(schedule: str) -> dict:
         raise ValueError(f"Invalid cron expression: {str(e)}")
 
 
-def validate_payload(payload: Dict[str, Any], schema: Dict[str, str]):
+# Supported api_schema type names
+TYPE_MAP = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool
+}
+
+# Compiled payload validators, keyed by trigger id
+_payload_adapters: Dict[int, TypeAdapter] = {}
+
+
+def build_payload_adapter(schema: Dict[str, str]) -> TypeAdapter:
+    """Compile an api_schema into a pydantic validator"""
+    # Functional TypedDict syntax accepts any field name, unlike a model
+    payload_type = TypedDict(
+        "TriggerPayload",
+        {field: TYPE_MAP[type_name] for field, type_name in schema.items()}
+    )
+    # Strict mode: no coercion such as "5" -> 5. TypeAdapter rejects a
+    # config argument for TypedDicts, so it goes on the type instead.
+    payload_type.__pydantic_config__ = ConfigDict(strict=True)
+    return TypeAdapter(payload_type)
+
+
+def get_payload_adapter(trigger: Trigger) -> TypeAdapter:
+    """Return the cached validator for a trigger, compiling it on first use"""
+    adapter = _payload_adapters.get(trigger.id)
+    if adapter is None:
+        adapter = build_payload_adapter(trigger.api_schema)
+        _payload_adapters[trigger.id] = adapter
+    return adapter
+
+
+def validate_payload(payload: Dict[str, Any], adapter: TypeAdapter, schema: Dict[str, str]):
     """Validate payload against schema"""
-    type_map = {
-        "str": str,
-        "int": int,
-        "float": float,
-        "bool": bool
-    }
-
-    for field, expected_type in schema.items():
-        if field not in payload:
+    try:
+        adapter.validate_python(payload)
+    except ValidationError as e:
+        error = e.errors()[0]
+        field = error["loc"][0]
+        if error["type"] == "missing":
             raise ValueError(f"Missing required field: {field}")
 
-        value = payload[field]
-        expected_python_type = type_map[expected_type]
-
-        if not isinstance(value, expected_python_type):
-            raise ValueError(
-                f"Invalid type for field '{field}'. Expected {expected_type}, got {type(value).__name__}"
-            )
+        raise ValueError(
+            f"Invalid type for field '{field}'. Expected {schema[field]}, got {type(error['input']).__name__}"
+        )
 
 
 def execute_trigger(trigger_id: int):
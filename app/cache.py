@@ -0,0 +1,24 @@
+# Redis connection pools shared by the cache and the scheduler job store
+
+import redis
+import redis.asyncio
+from app.config import settings
+
+# Values are JSON bytes or pickled jobs, so responses are not decoded to str
+REDIS_MAX_CONNECTIONS = 32
+
+# Async client for request handlers
+async_redis_pool = redis.asyncio.ConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=REDIS_MAX_CONNECTIONS,
+    decode_responses=False
+)
+async_redis_client = redis.asyncio.Redis(connection_pool=async_redis_pool)
+
+# Sync client for scheduler threads and the job store
+redis_pool = redis.ConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=REDIS_MAX_CONNECTIONS,
+    decode_responses=False
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
@@ -0,0 +1,36 @@
+# Application settings, read from the environment once at import
+
+from dataclasses import dataclass
+import os
+
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: str = os.getenv(
+        "DATABASE_URL",
+        "postgresql://postgres:postgres@db/events_db"
+    )
+    secret_key: str = os.getenv("SECRET_KEY", "your-secret-key-here")
+    algorithm: str = "HS256"
+    # Request-path connection pool, per worker process
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", 20))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    # Full URL so credentials, DB index and rediss:// TLS are kept; falls
+    # back to REDIS_HOST/REDIS_PORT when REDIS_URL is not set
+    redis_url: str = os.getenv("REDIS_URL") or (
+        f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{os.getenv('REDIS_PORT', 6379)}"
+    )
+    # Only the process with RUN_SCHEDULER=1 executes scheduled jobs
+    run_scheduler: bool = os.getenv("RUN_SCHEDULER", "0") == "1"
+    # bcrypt work factor; each increment doubles the time per hash/verify
+    bcrypt_rounds: int = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+    def __post_init__(self):
+        # bcrypt only supports costs 4-31; fail at startup, not on first hash
+        if not 4 <= self.bcrypt_rounds <= 31:
+            raise ValueError(
+                f"BCRYPT_ROUNDS must be between 4 and 31, got {self.bcrypt_rounds}"
+            )
+
+
+settings = Settings()
@@ -1,23 +1,45 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-import os
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.config import settings
 
-# Get database URL from environment variable or use default
-DATABASE_URL = os.getenv(
-    "DATABASE_URL",
-    "postgresql://postgres:postgres@db/events_db"
+DATABASE_URL = settings.database_url
+
+# Same database, reached through the asyncpg driver for request handlers
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+# Recycle connections before server/proxy idle timeouts drop them
+POOL_RECYCLE_SECONDS = 1800
+
+# Create SQLAlchemy engine (table creation, scheduler jobs and /events/cleanup
+# background tasks). The pool matches the scheduler's 8 worker threads; the
+# small overflow covers manual cleanups running alongside them.
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=8,
+    max_overflow=2,
+    pool_pre_ping=True,
+    pool_recycle=POOL_RECYCLE_SECONDS
 )
 
-# Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+# Create async engine used on the request path. Every worker process opens
+# up to pool_size + max_overflow connections here (plus 8 above), which must
+# stay below Postgres max_connections across all workers.
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=POOL_RECYCLE_SECONDS
+)
 
 # Create sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+# Create async sessionmaker; keep attributes loaded after commit so handlers
+# can return ORM objects without another round-trip
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
@@ -1,19 +1,22 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from apscheduler.schedulers.background import BackgroundScheduler
 from starlette.responses import RedirectResponse
 
 from app.api import triggers, events, auth
+from app.cache import async_redis_pool
+from app.config import settings
 from app.database import engine
 from app.models import Base
+from app.scheduler import scheduler
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
-# Initialize scheduler
-scheduler = BackgroundScheduler()
-scheduler.start()
+# Start the shared scheduler once all routers have registered their jobs.
+# Every process shares the Redis job store, so only the one flagged with
+# RUN_SCHEDULER executes jobs; the rest start paused and only write to it.
+scheduler.start(paused=not settings.run_scheduler)
 
 app = FastAPI(
     title="Event Trigger Platform",
@@ -60,12 +63,12 @@ async def root():
     return RedirectResponse(url="/docs")
 
 # Include routers
-# app.include_router(
-#     auth.router,
-#     prefix="/auth",
-#     tags=["Authentication"],
-#     # description="Operations for user authentication and registration"
-# )
+app.include_router(
+    auth.router,
+    prefix="/auth",
+    tags=["Authentication"],
+    # description="Operations for user authentication and registration"
+)
 
 app.include_router(
     triggers.router,
@@ -130,5 +133,7 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 @app.on_event("shutdown")
-def shutdown_event():
-    scheduler.shutdown()
\ No newline at end of file
+async def shutdown_event():
+    scheduler.shutdown(wait=False)
+    auth.hashing_executor.shutdown(wait=False)
+    await async_redis_pool.disconnect()
\ No newline at end of file
@@ -1,7 +1,8 @@
 # SQLAlchmey Models
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Boolean, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Enum, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 import enum
@@ -31,18 +32,35 @@ class Trigger(Base):
     name = Column(String)
     type = Column(Enum(TriggerType))
     schedule = Column(String, nullable=True)  # For scheduled triggers
-    api_schema = Column(JSON, nullable=True)  # For API triggers
+    api_schema = Column(JSONB, nullable=True)  # For API triggers
     created_at = Column(DateTime, default=datetime.utcnow)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Per-trigger listings: equality on status, range/order on triggered_at
+        Index("ix_events_trigger_status_triggered", "trigger_id", "status", "triggered_at"),
+        # Retention cleanup scans by status and age across all triggers
+        Index("ix_events_status_triggered", "status", "triggered_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     trigger_id = Column(Integer, ForeignKey("triggers.id"))
     status = Column(Enum(EventStatus), default=EventStatus.ACTIVE)
-    payload = Column(JSON, nullable=True)
+    payload = Column(JSONB, nullable=True)
     is_test = Column(Boolean, default=False)
     triggered_at = Column(DateTime, default=datetime.utcnow)
     archived_at = Column(DateTime, nullable=True)
-    deleted_at = Column(DateTime, nullable=True)
\ No newline at end of file
+    deleted_at = Column(DateTime, nullable=True)
+
+    trigger = relationship("Trigger")
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    token_hash = Column(String, unique=True, index=True)  # HMAC-SHA256 of the token
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime)
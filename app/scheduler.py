@@ -0,0 +1,32 @@
+# Process-wide APScheduler instance shared by all modules
+
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.redis import RedisJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+from app.cache import redis_pool
+
+scheduler = BackgroundScheduler(
+    # Keep jobs in Redis so triggers survive restarts and redeploys
+    jobstores={
+        "default": RedisJobStore(connection_pool=redis_pool)
+    },
+    executors={"default": ThreadPoolExecutor(8)},
+    job_defaults={"coalesce": True, "max_instances": 1}
+)
+
+
+def poll_job_store():
+    """No-op job that wakes the scheduler every minute
+
+    Jobs added by other processes go straight into Redis without notifying
+    the running scheduler, which otherwise sleeps until its next known job.
+    """
+
+
+scheduler.add_job(
+    poll_job_store,
+    'interval',
+    minutes=1,
+    id="poll_job_store",
+    replace_existing=True
+)
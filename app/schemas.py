@@ -1,21 +1,9 @@
 # Pydantic Schemas
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
-from sqlalchemy.ext.declarative import declarative_base
 from app.models import TriggerType, EventStatus
-import enum
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Enum
-
-Base = declarative_base()
-
-class User(Base):
-    __tablename__ = "users"
-
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String, unique=True, index=True)
-    hashed_password = Column(String)
 
 
 class UserBase(BaseModel):
@@ -35,9 +23,14 @@ class User(UserBase):
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
 class TriggerBase(BaseModel):
     name: str
     type: TriggerType
@@ -82,4 +75,14 @@ class EventResponse(EventBase):
     deleted_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class EventCursor(BaseModel):
+    triggered_at: datetime
+    id: int
+
+
+class EventPage(BaseModel):
+    items: List[EventResponse]
+    next_cursor: Optional[EventCursor] = None
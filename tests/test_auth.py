@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import auth
+from app.dependencies import get_db
+from app.models import RefreshToken, User
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    """Minimal stand-in for AsyncSession, storing users and refresh tokens in memory"""
+
+    def __init__(self):
+        self.users = {}
+        self.refresh_tokens = {}
+        self.pending = []
+        self.commits = 0
+
+    def add(self, obj):
+        self.pending.append(obj)
+
+    async def commit(self):
+        for obj in self.pending:
+            if isinstance(obj, RefreshToken):
+                self.refresh_tokens[obj.token_hash] = obj
+        self.pending = []
+        self.commits += 1
+
+    async def execute(self, statement):
+        params = statement.compile().params
+        if statement.is_delete:
+            # Refresh tokens are redeemed with DELETE ... RETURNING
+            token = self.refresh_tokens.pop(params.get("token_hash_1"), None)
+            return FakeResult([token] if token else [])
+        user = self.users.get(params.get("id_1"))
+        return FakeResult([user] if user else [])
+
+
+@pytest.fixture
+def db():
+    session = FakeSession()
+    session.users[1] = User(id=1, username="alice")
+    return session
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def store_refresh_token(db, token, user_id=1, expires_in=timedelta(days=1)):
+    token_hash = auth.hash_refresh_token(token)
+    db.refresh_tokens[token_hash] = RefreshToken(
+        user_id=user_id,
+        token_hash=token_hash,
+        expires_at=datetime.utcnow() + expires_in
+    )
+    return token_hash
+
+
+def test_refresh_returns_new_token_pair(client, db):
+    old_hash = store_refresh_token(db, "old-token")
+
+    response = client.post("/auth/refresh", json={"refresh_token": "old-token"})
+
+    assert response.status_code == 200
+    tokens = response.json()
+    assert tokens["access_token"]
+    assert tokens["refresh_token"] != "old-token"
+    assert old_hash not in db.refresh_tokens
+    assert auth.hash_refresh_token(tokens["refresh_token"]) in db.refresh_tokens
+
+
+def test_refresh_token_cannot_be_reused(client, db):
+    store_refresh_token(db, "old-token")
+    assert client.post("/auth/refresh", json={"refresh_token": "old-token"}).status_code == 200
+
+    response = client.post("/auth/refresh", json={"refresh_token": "old-token"})
+
+    assert response.status_code == 401
+    assert len(db.refresh_tokens) == 1
+
+
+def test_expired_refresh_token_is_rejected_and_removed(client, db):
+    token_hash = store_refresh_token(db, "old-token", expires_in=timedelta(seconds=-1))
+
+    response = client.post("/auth/refresh", json={"refresh_token": "old-token"})
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid or expired refresh token"
+    assert token_hash not in db.refresh_tokens
+    assert db.commits == 1
+
+
+def test_refresh_token_of_deleted_user_is_rejected(client, db):
+    store_refresh_token(db, "old-token", user_id=2)
+
+    response = client.post("/auth/refresh", json={"refresh_token": "old-token"})
+
+    assert response.status_code == 401
+    assert db.refresh_tokens == {}
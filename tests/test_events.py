@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.api.events import paginate, next_cursor
+from app.models import Event
+
+
+def cursor_params(before_triggered_at, before_id):
+    query = paginate(select(Event), before_triggered_at, before_id, 10)
+    return query.compile().params
+
+
+def test_paginate_without_cursor():
+    params = cursor_params(None, None)
+    assert params == {"param_1": 10}
+
+
+def test_paginate_with_naive_cursor():
+    cursor = datetime(2024, 2, 14, 10, 10)
+    params = cursor_params(cursor, 5)
+    assert cursor in params.values()
+    assert 5 in params.values()
+
+
+def test_paginate_converts_aware_cursor_to_naive_utc():
+    cursor = datetime(2024, 2, 14, 12, 10, tzinfo=timezone(timedelta(hours=2)))
+    params = cursor_params(cursor, 5)
+    assert datetime(2024, 2, 14, 10, 10) in params.values()
+
+
+def test_paginate_rejects_half_cursor():
+    with pytest.raises(HTTPException) as exc_info:
+        cursor_params(datetime(2024, 2, 14, 10, 10), None)
+    assert exc_info.value.status_code == 400
+
+
+def test_next_cursor():
+    events = [Event(id=i, triggered_at=datetime(2024, 2, 14, 10, i)) for i in range(3)]
+    assert next_cursor(events, 5) is None
+    assert next_cursor(events, 3) == {"triggered_at": datetime(2024, 2, 14, 10, 2), "id": 2}
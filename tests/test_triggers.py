@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import triggers
+from app.dependencies import get_db, get_current_user
+from app.models import Event, Trigger, User
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Minimal stand-in for AsyncSession, storing objects in memory"""
+
+    def __init__(self):
+        self.triggers = {}
+        self.events = []
+        self.pending = []
+
+    def add(self, obj):
+        self.pending.append(obj)
+
+    async def commit(self):
+        for obj in self.pending:
+            if isinstance(obj, Trigger):
+                obj.id = len(self.triggers) + 1
+                obj.created_at = datetime.utcnow()
+                self.triggers[obj.id] = obj
+            elif isinstance(obj, Event):
+                obj.id = len(self.events) + 1
+                self.events.append(obj)
+        self.pending = []
+
+    async def refresh(self, obj):
+        pass
+
+    async def execute(self, statement):
+        # Handlers look triggers up by id and owner
+        params = statement.compile().params
+        trigger = self.triggers.get(params.get("id_1"))
+        return FakeResult([trigger] if trigger else [])
+
+
+@pytest.fixture
+def db():
+    return FakeSession()
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(triggers.router, prefix="/triggers")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: User(id=1, username="alice")
+    triggers._payload_adapters.clear()
+    return TestClient(app)
+
+
+@pytest.fixture
+def api_trigger(client):
+    response = client.post("/triggers/api", json={
+        "name": "Payment Webhook",
+        "api_schema": {"amount": "float", "currency": "str", "user_id": "int"}
+    })
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_create_api_trigger(api_trigger, db):
+    assert api_trigger["type"] == "api"
+    assert api_trigger["api_schema"]["amount"] == "float"
+    assert api_trigger["id"] in db.triggers
+
+
+def test_create_api_trigger_rejects_unknown_type(client, db):
+    response = client.post("/triggers/api", json={
+        "name": "Bad",
+        "api_schema": {"amount": "decimal"}
+    })
+    assert response.status_code == 400
+    assert db.triggers == {}
+
+
+def test_trigger_with_valid_payload(client, api_trigger, db):
+    response = client.post(f"/triggers/{api_trigger['id']}/test", json={
+        "amount": 99.99,
+        "currency": "USD",
+        "user_id": 123
+    })
+    assert response.status_code == 200
+    assert response.json()["message"] == "Test trigger executed successfully"
+    assert db.events[0].is_test
+
+
+def test_trigger_with_missing_field(client, api_trigger, db):
+    response = client.post(f"/triggers/{api_trigger['id']}/test", json={
+        "amount": 99.99,
+        "currency": "USD"
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Missing required field: user_id"
+    assert db.events == []
+
+
+def test_trigger_with_wrong_type(client, api_trigger, db):
+    response = client.post(f"/triggers/{api_trigger['id']}/test", json={
+        "amount": 99.99,
+        "currency": "USD",
+        "user_id": "123"
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        "Invalid type for field 'user_id'. Expected int, got str"
+    )
+    assert db.events == []
+
+
+def test_unknown_trigger(client):
+    response = client.post("/triggers/42/test", json={"amount": 1.0})
+    assert response.status_code == 404